@@ -1,1069 +1,1334 @@
-"""
-GymChat Pro - Premium Multi-Unit Gym Management System
-Modern UI with glassmorphism, animations, and premium design
-
-To create EXE:
-pip install pyinstaller tkinter pillow python-dateutil openpyxl
-pyinstaller --onefile --windowed --name GymChatPro gym_chat_pro.py
-"""
-
-import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext, filedialog
-import sqlite3
-import pathlib
-from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
-import hashlib
-import json
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-
-class ModernStyle:
-    """Modern UI styling with premium colors and effects"""
-    
-    # Premium color palette - Dark mode with vibrant accents
-    BG_DARK = '#0A0E27'
-    BG_CARD = '#1A1F3A'
-    BG_CARD_HOVER = '#252B4A'
-    
-    ACCENT_PRIMARY = '#6C5CE7'  # Purple
-    ACCENT_SECONDARY = '#A29BFE'  # Light purple
-    ACCENT_SUCCESS = '#00D9A3'  # Mint green
-    ACCENT_WARNING = '#FDCB6E'  # Gold
-    ACCENT_DANGER = '#FF6B6B'  # Coral red
-    
-    TEXT_PRIMARY = '#FFFFFF'
-    TEXT_SECONDARY = '#A0AEC0'
-    TEXT_MUTED = '#718096'
-    
-    GRADIENT_START = '#667EEA'
-    GRADIENT_END = '#764BA2'
-    
-    # Chat colors
-    CHAT_BG = '#0F1419'
-    MY_MESSAGE = '#6C5CE7'
-    OTHER_MESSAGE = '#2D3748'
-    
-    # Fonts
-    FONT_HEADING = ('Segoe UI', 24, 'bold')
-    FONT_SUBHEADING = ('Segoe UI', 16, 'bold')
-    FONT_BODY = ('Segoe UI', 11)
-    FONT_BODY_BOLD = ('Segoe UI', 11, 'bold')
-    FONT_SMALL = ('Segoe UI', 9)
-    FONT_BUTTON = ('Segoe UI', 10, 'bold')
-
-class DatabaseManager:
-    """Manages multiple databases for different gym units"""
-    
-    def __init__(self):
-        self.base_path = pathlib.Path('gym_units')
-        self.base_path.mkdir(exist_ok=True)
-        self.units = ['unit1', 'unit2', 'unit3', 'unit4', 'unit5', 'unit6', 'unit7']
-        
-    def get_db_path(self, unit):
-        return self.base_path / f'{unit}.db'
-    
-    def get_db(self, unit):
-        con = sqlite3.connect(self.get_db_path(unit))
-        con.row_factory = sqlite3.Row
-        return con
-    
-    def init_all_databases(self):
-        for unit in self.units:
-            self.init_unit_db(unit)
-        self.init_auth_db()
-    
-    def init_unit_db(self, unit):
-        con = self.get_db(unit)
-        con.executescript("""
-            PRAGMA foreign_keys = ON;
-            
-            CREATE TABLE IF NOT EXISTS members (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                phone TEXT NOT NULL UNIQUE,
-                email TEXT,
-                gender TEXT,
-                dob TEXT,
-                created_at TEXT DEFAULT (datetime('now')),
-                avatar TEXT DEFAULT '👤'
-            );
-            
-            CREATE TABLE IF NOT EXISTS plans (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL UNIQUE,
-                duration_months INTEGER NOT NULL CHECK(duration_months > 0),
-                price REAL NOT NULL CHECK(price >= 0)
-            );
-            
-            CREATE TABLE IF NOT EXISTS subscriptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                member_id INTEGER NOT NULL REFERENCES members(id) ON DELETE CASCADE,
-                plan_id INTEGER NOT NULL REFERENCES plans(id),
-                start_date TEXT NOT NULL,
-                end_date TEXT NOT NULL,
-                status TEXT NOT NULL DEFAULT 'active',
-                notes TEXT
-            );
-            
-            CREATE TABLE IF NOT EXISTS chats (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chat_id TEXT UNIQUE NOT NULL,
-                chat_name TEXT NOT NULL,
-                chat_type TEXT NOT NULL,
-                member_id INTEGER REFERENCES members(id),
-                created_at TEXT DEFAULT (datetime('now'))
-            );
-            
-            CREATE TABLE IF NOT EXISTS messages (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                chat_id TEXT NOT NULL,
-                sender_name TEXT NOT NULL,
-                sender_role TEXT NOT NULL,
-                message TEXT NOT NULL,
-                timestamp TEXT DEFAULT (datetime('now')),
-                read_status INTEGER DEFAULT 0
-            );
-            
-            CREATE TABLE IF NOT EXISTS notifications (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                subscription_id INTEGER REFERENCES subscriptions(id),
-                member_id INTEGER REFERENCES members(id),
-                channel TEXT NOT NULL,
-                message TEXT NOT NULL,
-                sent_at TEXT,
-                status TEXT DEFAULT 'pending'
-            );
-            
-            INSERT OR IGNORE INTO plans(name, duration_months, price) VALUES 
-                ('Monthly', 1, 999.0),
-                ('Quarterly', 3, 2699.0),
-                ('Half-Yearly', 6, 4999.0),
-                ('Yearly', 12, 8999.0);
-                
-            INSERT OR IGNORE INTO chats(chat_id, chat_name, chat_type) 
-            VALUES ('group_general', 'General Announcements', 'group');
-        """)
-        con.commit()
-        
-        # Add sample data if no members exist
-        member_count = con.execute("SELECT COUNT(*) FROM members").fetchone()[0]
-        if member_count == 0:
-            self.add_sample_data(con)
-        
-        con.close()
-    
-    def add_sample_data(self, con):
-        """Add sample members and subscriptions"""
-        import random
-        
-        # Sample data
-        avatars = ['👨', '👩', '🧑', '👨‍💼', '👩‍💼', '🧔', '👨‍🦱', '👩‍🦰', '👨‍🦳', '👩‍🦳']
-        first_names = ['Raj', 'Priya', 'Amit', 'Sneha', 'Vikram', 'Anjali', 'Rahul', 'Divya', 
-                      'Arjun', 'Kavya', 'Karthik', 'Meera', 'Suresh', 'Lakshmi', 'Arun']
-        last_names = ['Kumar', 'Sharma', 'Patel', 'Singh', 'Reddy', 'Nair', 'Iyer', 'Gupta',
-                     'Rao', 'Joshi', 'Mehta', 'Shah', 'Pillai', 'Menon', 'Agarwal']
-        
-        today = date.today()
-        
-        # Reduced to 10 sample members for faster initial load
-        members = []
-        for i in range(10):
-            name = f"{random.choice(first_names)} {random.choice(last_names)}"
-            phone = f"+91{7000000000 + i * 111111111}"  # Sequential to avoid collisions
-            email = f"member{i}@email.com"
-            gender = random.choice(['Male', 'Female'])
-            avatar = random.choice(avatars)
-            dob = date(random.randint(1985, 2000), random.randint(1, 12), random.randint(1, 28)).isoformat()
-            
-            cur = con.execute("""
-                INSERT INTO members(name, phone, email, gender, dob, avatar)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (name, phone, email, gender, dob, avatar))
-            members.append(cur.lastrowid)
-        
-        # Create subscriptions with various expiry dates
-        plan_ids = [1, 2, 3, 4]  # Monthly, Quarterly, Half-Yearly, Yearly
-        
-        # Batch insert for better performance
-        subscription_data = []
-        for member_id in members:
-            plan_id = random.choice(plan_ids)
-            
-            # Get plan duration
-            plan = con.execute("SELECT duration_months FROM plans WHERE id = ?", (plan_id,)).fetchone()
-            duration = plan[0]
-            
-            # Random start date in past (0-6 months ago)
-            months_ago = random.randint(0, 6)
-            start_date = today - relativedelta(months=months_ago)
-            end_date = start_date + relativedelta(months=duration)
-            
-            # Create different scenarios
-            scenario = random.random()
-            if scenario < 0.2:  # 20% expired
-                start_date = today - relativedelta(months=duration+2)
-                end_date = today - relativedelta(months=2)
-            elif scenario < 0.4:  # 20% expiring within 30 days
-                start_date = today - relativedelta(months=duration, days=-15)
-                end_date = today + relativedelta(days=15)
-            
-            notes = random.choice(['Regular member', 'Morning batch', 'Evening batch', ''])
-            
-            subscription_data.append((member_id, plan_id, start_date.isoformat(), 
-                                    end_date.isoformat(), notes))
-        
-        # Batch insert all subscriptions
-        con.executemany("""
-            INSERT INTO subscriptions(member_id, plan_id, start_date, end_date, status, notes)
-            VALUES (?, ?, ?, ?, 'active', ?)
-        """, subscription_data)
-        
-        con.commit()
-    
-    def init_auth_db(self):
-        auth_path = self.base_path / 'auth.db'
-        con = sqlite3.connect(auth_path)
-        con.executescript("""
-            CREATE TABLE IF NOT EXISTS users (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                username TEXT NOT NULL UNIQUE,
-                password_hash TEXT NOT NULL,
-                role TEXT NOT NULL,
-                unit TEXT,
-                full_name TEXT NOT NULL,
-                created_at TEXT DEFAULT (datetime('now'))
-            );
-            
-            CREATE TABLE IF NOT EXISTS login_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                user_id INTEGER REFERENCES users(id),
-                login_time TEXT DEFAULT (datetime('now')),
-                unit_accessed TEXT
-            );
-        """)
-        
-        owner_hash = hashlib.sha256('owner123'.encode()).hexdigest()
-        con.execute("""
-            INSERT OR IGNORE INTO users(username, password_hash, role, full_name)
-            VALUES ('owner', ?, 'owner', 'Gym Owner')
-        """, (owner_hash,))
-        
-        for unit in self.units:
-            unit_hash = hashlib.sha256(unit.encode()).hexdigest()
-            con.execute("""
-                INSERT OR IGNORE INTO users(username, password_hash, role, unit, full_name)
-                VALUES (?, ?, 'unit_admin', ?, ?)
-            """, (unit, unit_hash, unit, f'{unit.title()} Admin'))
-        
-        con.commit()
-        con.close()
-
-class ModernButton(tk.Canvas):
-    """Custom modern button with hover effects"""
-    
-    def __init__(self, parent, text, command, bg_color, fg_color='white', 
-                 width=150, height=45, icon='', **kwargs):
-        super().__init__(parent, width=width, height=height, 
-                        bg=parent['bg'], highlightthickness=0, **kwargs)
-        
-        self.bg_color = bg_color
-        self.fg_color = fg_color
-        self.text = text
-        self.icon = icon
-        self.command = command
-        self.hover = False
-        
-        self.draw_button()
-        self.bind('<Button-1>', lambda e: self.on_click())
-        self.bind('<Enter>', lambda e: self.on_hover(True))
-        self.bind('<Leave>', lambda e: self.on_hover(False))
-        
-    def draw_button(self):
-        self.delete('all')
-        
-        # Button background with rounded corners
-        radius = 23
-        color = self.adjust_color(self.bg_color, 1.2 if self.hover else 1.0)
-        
-        self.create_arc(0, 0, radius*2, radius*2, 
-                       start=90, extent=90, fill=color, outline='')
-        self.create_arc(self.winfo_reqwidth()-radius*2, 0, 
-                       self.winfo_reqwidth(), radius*2,
-                       start=0, extent=90, fill=color, outline='')
-        self.create_arc(0, self.winfo_reqheight()-radius*2, 
-                       radius*2, self.winfo_reqheight(),
-                       start=180, extent=90, fill=color, outline='')
-        self.create_arc(self.winfo_reqwidth()-radius*2, 
-                       self.winfo_reqheight()-radius*2,
-                       self.winfo_reqwidth(), self.winfo_reqheight(),
-                       start=270, extent=90, fill=color, outline='')
-        
-        self.create_rectangle(radius, 0, self.winfo_reqwidth()-radius, 
-                            self.winfo_reqheight(), fill=color, outline='')
-        self.create_rectangle(0, radius, self.winfo_reqwidth(), 
-                            self.winfo_reqheight()-radius, fill=color, outline='')
-        
-        # Text
-        full_text = f"{self.icon} {self.text}" if self.icon else self.text
-        self.create_text(self.winfo_reqwidth()//2, self.winfo_reqheight()//2,
-                        text=full_text, fill=self.fg_color, 
-                        font=ModernStyle.FONT_BUTTON)
-    
-    def adjust_color(self, color, factor):
-        """Lighten or darken a color"""
-        color = color.lstrip('#')
-        r, g, b = int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
-        r = min(255, int(r * factor))
-        g = min(255, int(g * factor))
-        b = min(255, int(b * factor))
-        return f'#{r:02x}{g:02x}{b:02x}'
-    
-    def on_hover(self, entering):
-        self.hover = entering
-        self.draw_button()
-        self.config(cursor='hand2' if entering else '')
-    
-    def on_click(self):
-        if self.command:
-            self.command()
-
-class ModernEntry(tk.Frame):
-    """Modern entry field with floating label effect"""
-    
-    def __init__(self, parent, label, show=None):
-        super().__init__(parent, bg=ModernStyle.BG_CARD)
-        
-        self.label_text = label
-        
-        tk.Label(self, text=label, font=ModernStyle.FONT_SMALL,
-                bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', pady=(0, 5))
-        
-        entry_frame = tk.Frame(self, bg=ModernStyle.BG_DARK, bd=0)
-        entry_frame.pack(fill=tk.X)
-        
-        self.entry = tk.Entry(entry_frame, font=ModernStyle.FONT_BODY,
-                             bg=ModernStyle.BG_DARK, fg=ModernStyle.TEXT_PRIMARY,
-                             insertbackground=ModernStyle.ACCENT_PRIMARY,
-                             relief=tk.FLAT, bd=0, show=show)
-        self.entry.pack(fill=tk.X, padx=15, pady=12)
-        
-    def get(self):
-        return self.entry.get()
-    
-    def insert(self, index, text):
-        self.entry.insert(index, text)
-
-class LoginWindow:
-    """Premium login window with gradient background"""
-    
-    def __init__(self, parent, on_success):
-        self.parent = parent
-        self.on_success = on_success
-        self.window = tk.Toplevel(parent)
-        self.window.title("GymChat Pro - Login")
-        self.window.geometry("500x700")
-        self.window.configure(bg=ModernStyle.BG_DARK)
-        self.window.transient(parent)
-        self.window.grab_set()
-        
-        # Center window
-        self.window.update_idletasks()
-        x = (self.window.winfo_screenwidth() // 2) - 250
-        y = (self.window.winfo_screenheight() // 2) - 350
-        self.window.geometry(f'500x700+{x}+{y}')
-        
-        self.setup_ui()
-        
-    def setup_ui(self):
-        # Header with gradient effect
-        header = tk.Frame(self.window, bg=ModernStyle.BG_CARD, height=200)
-        header.pack(fill=tk.X)
-        header.pack_propagate(False)
-        
-        # Logo and title
-        logo_frame = tk.Frame(header, bg=ModernStyle.BG_CARD)
-        logo_frame.pack(expand=True)
-        
-        tk.Label(logo_frame, text="💪", font=('Arial', 60),
-                bg=ModernStyle.BG_CARD).pack()
-        
-        tk.Label(logo_frame, text="GymChat Pro", 
-                font=('Segoe UI', 32, 'bold'),
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_PRIMARY).pack()
-        
-        tk.Label(logo_frame, text="Multi-Unit Management System", 
-                font=ModernStyle.FONT_BODY,
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_SECONDARY).pack(pady=(5, 0))
-        
-        # Form container
-        form_container = tk.Frame(self.window, bg=ModernStyle.BG_DARK)
-        form_container.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
-        
-        # Login form card
-        form_card = tk.Frame(form_container, bg=ModernStyle.BG_CARD, bd=0)
-        form_card.pack(fill=tk.BOTH, expand=True)
-        
-        form_inner = tk.Frame(form_card, bg=ModernStyle.BG_CARD)
-        form_inner.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
-        
-        tk.Label(form_inner, text="Welcome Back!", 
-                font=ModernStyle.FONT_SUBHEADING,
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_PRIMARY).pack(pady=(0, 30))
-        
-        # Username field
-        self.username_field = ModernEntry(form_inner, "Username")
-        self.username_field.pack(fill=tk.X, pady=(0, 20))
-        
-        # Password field
-        self.password_field = ModernEntry(form_inner, "Password", show='●')
-        self.password_field.pack(fill=tk.X, pady=(0, 30))
-        self.password_field.entry.bind('<Return>', lambda e: self.login())
-        
-        # Login button
-        btn_frame = tk.Frame(form_inner, bg=ModernStyle.BG_CARD)
-        btn_frame.pack(fill=tk.X)
-        
-        login_btn = ModernButton(btn_frame, "Login", self.login,
-                                ModernStyle.ACCENT_PRIMARY, 
-                                width=400, height=50, icon='🔐')
-        login_btn.pack(pady=(0, 20))
-        
-        # Info card
-        info_card = tk.Frame(form_inner, bg=ModernStyle.BG_DARK, bd=0)
-        info_card.pack(fill=tk.X, pady=(10, 0))
-        
-        info_inner = tk.Frame(info_card, bg=ModernStyle.BG_DARK)
-        info_inner.pack(fill=tk.X, padx=20, pady=20)
-        
-        tk.Label(info_inner, text="ℹ  Default Credentials", 
-                font=ModernStyle.FONT_BODY_BOLD,
-                bg=ModernStyle.BG_DARK, 
-                fg=ModernStyle.ACCENT_WARNING).pack(pady=(0, 10))
-        
-        tk.Label(info_inner, text="Owner: owner / owner123",
-                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
-                fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', padx=20)
-        
-        tk.Label(info_inner, text="Unit Admin: unit1 / unit1",
-                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
-                fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', padx=20)
-        
-        tk.Label(info_inner, text="(unit2-unit7 follow same pattern)",
-                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
-                fg=ModernStyle.TEXT_MUTED).pack(anchor='w', padx=20, pady=(0, 5))
-        
-    def login(self):
-        username = self.username_field.get().strip()
-        password = self.password_field.get().strip()
-        
-        if not username or not password:
-            messagebox.showerror("Error", "Please enter username and password")
-            return
-        
-        password_hash = hashlib.sha256(password.encode()).hexdigest()
-        
-        auth_path = pathlib.Path('gym_units') / 'auth.db'
-        con = sqlite3.connect(auth_path)
-        con.row_factory = sqlite3.Row
-        
-        user = con.execute("""
-            SELECT * FROM users 
-            WHERE username = ? AND password_hash = ?
-        """, (username, password_hash)).fetchone()
-        
-        if user:
-            con.execute("""
-                INSERT INTO login_logs(user_id, unit_accessed)
-                VALUES (?, ?)
-            """, (user['id'], user['unit']))
-            con.commit()
-            con.close()
-            
-            user_data = {
-                'id': user['id'],
-                'username': user['username'],
-                'role': user['role'],
-                'unit': user['unit'],
-                'full_name': user['full_name']
-            }
-            
-            self.window.destroy()
-            self.on_success(user_data)
-        else:
-            con.close()
-            messagebox.showerror("Login Failed", "Invalid username or password")
-
-class GymChatApp:
-    """Main application with premium UI"""
-    
-    def __init__(self, root):
-        self.root = root
-        self.root.title("GymChat Pro - Multi-Unit Management")
-        self.root.geometry("1400x850")
-        self.root.minsize(1200, 700)
-        self.root.configure(bg=ModernStyle.BG_DARK)
-        
-        # Show loading splash
-        self.show_loading_splash()
-        
-        # Initialize database in background
-        self.root.after(100, self.init_database)
-        
-    def show_loading_splash(self):
-        """Show loading splash screen"""
-        self.splash = tk.Toplevel(self.root)
-        self.splash.title("Loading...")
-        self.splash.geometry("400x300")
-        self.splash.configure(bg=ModernStyle.BG_CARD)
-        self.splash.overrideredirect(True)
-        
-        # Center splash
-        self.splash.update_idletasks()
-        x = (self.splash.winfo_screenwidth() // 2) - 200
-        y = (self.splash.winfo_screenheight() // 2) - 150
-        self.splash.geometry(f'400x300+{x}+{y}')
-        
-        tk.Label(self.splash, text="💪", font=('Arial', 60),
-                bg=ModernStyle.BG_CARD).pack(pady=(40, 20))
-        
-        tk.Label(self.splash, text="GymChat Pro", 
-                font=('Segoe UI', 28, 'bold'),
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_PRIMARY).pack()
-        
-        tk.Label(self.splash, text="Loading databases...", 
-                font=ModernStyle.FONT_BODY,
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_SECONDARY).pack(pady=(20, 0))
-        
-    def init_database(self):
-        """Initialize database"""
-        self.db_manager = DatabaseManager()
-        self.db_manager.init_all_databases()
-        
-        self.current_user = None
-        self.current_unit = None
-        self.active_chat = None
-        
-        # Close splash and show login
-        self.splash.destroy()
-        self.root.withdraw()
-        LoginWindow(self.root, self.on_login_success)
-        
-    def on_login_success(self, user_data):
-        self.current_user = user_data
-        
-        if user_data['role'] == 'owner':
-            self.accessible_units = self.db_manager.units
-            self.current_unit = 'unit1'
-        else:
-            self.accessible_units = [user_data['unit']]
-            self.current_unit = user_data['unit']
-        
-        self.root.deiconify()
-        self.setup_ui()
-        
-    def create_gradient_header(self, parent):
-        """Create gradient header"""
-        canvas = tk.Canvas(parent, height=80, bg=ModernStyle.BG_CARD, 
-                          highlightthickness=0)
-        canvas.pack(fill=tk.X)
-        
-        # Create gradient effect using overlapping rectangles
-        for i in range(80):
-            ratio = i / 80
-            r1, g1, b1 = int('66', 16), int('7E', 16), int('EA', 16)
-            r2, g2, b2 = int('76', 16), int('4B', 16), int('A2', 16)
-            
-            r = int(r1 + (r2 - r1) * ratio)
-            g = int(g1 + (g2 - g1) * ratio)
-            b = int(b1 + (b2 - b1) * ratio)
-            
-            color = f'#{r:02x}{g:02x}{b:02x}'
-            canvas.create_line(0, i, 1400, i, fill=color)
-        
-        return canvas
-        
-    def setup_ui(self):
-        # Premium top bar with gradient
-        top_bar = tk.Frame(self.root, height=80)
-        top_bar.pack(fill=tk.X, side=tk.TOP)
-        top_bar.pack_propagate(False)
-        
-        gradient_canvas = self.create_gradient_header(top_bar)
-        
-        # Title and logo
-        title_frame = tk.Frame(gradient_canvas, bg='')
-        gradient_canvas.create_window(20, 40, window=title_frame, anchor='w')
-        
-        tk.Label(title_frame, text="💪", font=('Arial', 28),
-                bg='').pack(side=tk.LEFT, padx=(0, 10))
-        
-        title_text = tk.Frame(title_frame, bg='')
-        title_text.pack(side=tk.LEFT)
-        
-        tk.Label(title_text, text="GymChat Pro", 
-                font=('Segoe UI', 20, 'bold'),
-                fg=ModernStyle.TEXT_PRIMARY, bg='').pack(anchor='w')
-        
-        tk.Label(title_text, text="Multi-Unit Management System", 
-                font=ModernStyle.FONT_SMALL,
-                fg=ModernStyle.TEXT_SECONDARY, bg='').pack(anchor='w')
-        
-        # Unit selector for owner
-        if self.current_user['role'] == 'owner':
-            unit_frame = tk.Frame(gradient_canvas, bg='')
-            gradient_canvas.create_window(500, 40, window=unit_frame, anchor='w')
-            
-            tk.Label(unit_frame, text="Active Unit:", 
-                    font=ModernStyle.FONT_BODY_BOLD,
-                    fg=ModernStyle.TEXT_PRIMARY, bg='').pack(side=tk.LEFT, padx=(0, 10))
-            
-            style = ttk.Style()
-            style.configure('Unit.TCombobox', 
-                          fieldbackground=ModernStyle.BG_DARK,
-                          background=ModernStyle.ACCENT_PRIMARY,
-                          foreground=ModernStyle.TEXT_PRIMARY)
-            
-            self.unit_var = tk.StringVar(value=self.current_unit)
-            unit_menu = ttk.Combobox(unit_frame, textvariable=self.unit_var,
-                                    values=self.accessible_units, state='readonly',
-                                    width=12, font=ModernStyle.FONT_BODY,
-                                    style='Unit.TCombobox')
-            unit_menu.pack(side=tk.LEFT)
-            unit_menu.bind('<<ComboboxSelected>>', self.on_unit_change)
-        
-        # User profile section
-        user_frame = tk.Frame(gradient_canvas, bg='')
-        gradient_canvas.create_window(1350, 40, window=user_frame, anchor='e')
-        
-        profile_card = tk.Frame(user_frame, bg=ModernStyle.BG_CARD_HOVER, bd=0)
-        profile_card.pack(side=tk.RIGHT)
-        
-        profile_inner = tk.Frame(profile_card, bg=ModernStyle.BG_CARD_HOVER)
-        profile_inner.pack(padx=15, pady=8)
-        
-        role_emoji = '👑' if self.current_user['role'] == 'owner' else '⭐'
-        
-        tk.Label(profile_inner, text=f"{role_emoji} {self.current_user['full_name']}", 
-                font=ModernStyle.FONT_BODY_BOLD,
-                bg=ModernStyle.BG_CARD_HOVER, 
-                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT, padx=(0, 15))
-        
-        logout_btn = tk.Label(profile_inner, text="🚪 Logout",
-                            font=ModernStyle.FONT_SMALL,
-                            bg=ModernStyle.ACCENT_DANGER, 
-                            fg='white', cursor='hand2',
-                            padx=12, pady=4)
-        logout_btn.pack(side=tk.LEFT)
-        logout_btn.bind('<Button-1>', lambda e: self.logout())
-        
-        # Main container
-        main_container = tk.Frame(self.root, bg=ModernStyle.BG_DARK)
-        main_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
-        
-        self.setup_content_area(main_container)
-        
-    def setup_content_area(self, parent):
-        content = tk.Frame(parent, bg=ModernStyle.BG_DARK)
-        content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-        
-        # Title
-        title_frame = tk.Frame(content, bg=ModernStyle.BG_DARK)
-        title_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        tk.Label(title_frame, text=f"📊 Membership Manager - {self.current_unit.upper()}", 
-                font=ModernStyle.FONT_HEADING,
-                bg=ModernStyle.BG_DARK, 
-                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
-        
-        # Month filter
-        filter_frame = tk.Frame(content, bg=ModernStyle.BG_CARD)
-        filter_frame.pack(fill=tk.X, pady=(0, 20))
-        
-        filter_inner = tk.Frame(filter_frame, bg=ModernStyle.BG_CARD)
-        filter_inner.pack(padx=20, pady=15)
-        
-        tk.Label(filter_inner, text="Filter by Expiry Month:", 
-                font=ModernStyle.FONT_BODY_BOLD,
-                bg=ModernStyle.BG_CARD, 
-                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT, padx=(0, 15))
-        
-        # Month selector
-        months = ['All', 'January', 'February', 'March', 'April', 'May', 'June',
-                 'July', 'August', 'September', 'October', 'November', 'December']
-        
-        self.month_var = tk.StringVar(value='All')
-        month_menu = ttk.Combobox(filter_inner, textvariable=self.month_var,
-                                 values=months, state='readonly',
-                                 width=15, font=ModernStyle.FONT_BODY)
-        month_menu.pack(side=tk.LEFT, padx=(0, 15))
-        month_menu.bind('<<ComboboxSelected>>', lambda e: self.load_memberships())
-        
-        # Year selector
-        current_year = datetime.now().year
-        years = ['All'] + [str(y) for y in range(current_year, current_year + 3)]
-        
-        self.year_var = tk.StringVar(value=str(current_year))
-        year_menu = ttk.Combobox(filter_inner, textvariable=self.year_var,
-                                values=years, state='readonly',
-                                width=10, font=ModernStyle.FONT_BODY)
-        year_menu.pack(side=tk.LEFT, padx=(0, 15))
-        year_menu.bind('<<ComboboxSelected>>', lambda e: self.load_memberships())
-        
-        # Export button
-        export_btn = ModernButton(filter_inner, "Export to Excel", self.export_to_excel,
-                                 ModernStyle.ACCENT_SUCCESS, width=180, height=40, icon='📥')
-        export_btn.pack(side=tk.LEFT, padx=(15, 0))
-        
-        # Membership table
-        table_frame = tk.Frame(content, bg=ModernStyle.BG_CARD)
-        table_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Table header
-        header_frame = tk.Frame(table_frame, bg=ModernStyle.ACCENT_PRIMARY, height=45)
-        header_frame.pack(fill=tk.X)
-        header_frame.pack_propagate(False)
-        
-        columns = [
-            ("Member Name", 200),
-            ("Phone", 150),
-            ("Plan", 120),
-            ("Start Date", 120),
-            ("End Date", 120),
-            ("Days Left", 100),
-            ("Status", 120)
-        ]
-        
-        for col_name, width in columns:
-            tk.Label(header_frame, text=col_name, 
-                    font=ModernStyle.FONT_BODY_BOLD,
-                    bg=ModernStyle.ACCENT_PRIMARY, 
-                    fg='white', width=width//8).pack(side=tk.LEFT, padx=5, pady=10)
-        
-        # Scrollable content
-        canvas = tk.Canvas(table_frame, bg=ModernStyle.BG_CARD, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=canvas.yview)
-        self.membership_frame = tk.Frame(canvas, bg=ModernStyle.BG_CARD)
-        
-        self.membership_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=self.membership_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        
-        # Load initial data
-        self.load_memberships()
-        
-    def load_memberships(self):
-        """Load membership data based on filters"""
-        # Clear existing rows
-        for widget in self.membership_frame.winfo_children():
-            widget.destroy()
-        
-        con = self.db_manager.get_db(self.current_unit)
-        
-        # Build query based on filters
-        query = """
-            SELECT 
-                m.id, m.name, m.phone, m.avatar,
-                p.name as plan_name,
-                s.start_date, s.end_date, s.status
-            FROM subscriptions s
-            JOIN members m ON s.member_id = m.id
-            JOIN plans p ON s.plan_id = p.id
-            WHERE s.status = 'active'
-        """
-        
-        params = []
-        
-        # Apply month filter
-        if self.month_var.get() != 'All':
-            month_num = ['January', 'February', 'March', 'April', 'May', 'June',
-                        'July', 'August', 'September', 'October', 'November', 'December'].index(self.month_var.get()) + 1
-            query += " AND CAST(strftime('%m', s.end_date) AS INTEGER) = ?"
-            params.append(month_num)
-        
-        # Apply year filter
-        if self.year_var.get() != 'All':
-            query += " AND strftime('%Y', s.end_date) = ?"
-            params.append(self.year_var.get())
-        
-        query += " ORDER BY s.end_date ASC"
-        
-        memberships = con.execute(query, params).fetchall()
-        con.close()
-        
-        today = date.today()
-        
-        for idx, membership in enumerate(memberships):
-            end_date = datetime.strptime(membership['end_date'], '%Y-%m-%d').date()
-            days_left = (end_date - today).days
-            
-            # Determine status color
-            if days_left < 0:
-                status_text = "Expired"
-                status_color = ModernStyle.ACCENT_DANGER
-            elif days_left <= 7:
-                status_text = "Expiring Soon"
-                status_color = ModernStyle.ACCENT_DANGER
-            elif days_left <= 30:
-                status_text = "Expiring"
-                status_color = ModernStyle.ACCENT_WARNING
-            else:
-                status_text = "Active"
-                status_color = ModernStyle.ACCENT_SUCCESS
-            
-            # Row frame
-            row_bg = ModernStyle.BG_DARK if idx % 2 == 0 else ModernStyle.BG_CARD_HOVER
-            row_frame = tk.Frame(self.membership_frame, bg=row_bg, height=50)
-            row_frame.pack(fill=tk.X)
-            row_frame.pack_propagate(False)
-            
-            # Member name with avatar
-            name_frame = tk.Frame(row_frame, bg=row_bg, width=200)
-            name_frame.pack(side=tk.LEFT, padx=5, pady=5)
-            name_frame.pack_propagate(False)
-            
-            tk.Label(name_frame, text=f"{membership['avatar']} {membership['name']}", 
-                    font=ModernStyle.FONT_BODY,
-                    bg=row_bg, fg=ModernStyle.TEXT_PRIMARY,
-                    anchor='w').pack(fill=tk.X, padx=5)
-            
-            # Phone
-            phone_frame = tk.Frame(row_frame, bg=row_bg, width=150)
-            phone_frame.pack(side=tk.LEFT, padx=5)
-            phone_frame.pack_propagate(False)
-            
-            tk.Label(phone_frame, text=membership['phone'], 
-                    font=ModernStyle.FONT_BODY,
-                    bg=row_bg, fg=ModernStyle.TEXT_SECONDARY,
-                    anchor='w').pack(fill=tk.X, padx=5)
-            
-            # Plan
-            plan_frame = tk.Frame(row_frame, bg=row_bg, width=120)
-            plan_frame.pack(side=tk.LEFT, padx=5)
-            plan_frame.pack_propagate(False)
-            
-            tk.Label(plan_frame, text=membership['plan_name'], 
-                    font=ModernStyle.FONT_BODY_BOLD,
-                    bg=row_bg, fg=ModernStyle.ACCENT_SECONDARY,
-                    anchor='w').pack(fill=tk.X, padx=5)
-            
-            # Start date
-            start_frame = tk.Frame(row_frame, bg=row_bg, width=120)
-            start_frame.pack(side=tk.LEFT, padx=5)
-            start_frame.pack_propagate(False)
-            
-            tk.Label(start_frame, text=membership['start_date'], 
-                    font=ModernStyle.FONT_BODY,
-                    bg=row_bg, fg=ModernStyle.TEXT_SECONDARY,
-                    anchor='w').pack(fill=tk.X, padx=5)
-            
-            # End date
-            end_frame = tk.Frame(row_frame, bg=row_bg, width=120)
-            end_frame.pack(side=tk.LEFT, padx=5)
-            end_frame.pack_propagate(False)
-            
-            tk.Label(end_frame, text=membership['end_date'], 
-                    font=ModernStyle.FONT_BODY,
-                    bg=row_bg, fg=ModernStyle.TEXT_SECONDARY,
-                    anchor='w').pack(fill=tk.X, padx=5)
-            
-            # Days left
-            days_frame = tk.Frame(row_frame, bg=row_bg, width=100)
-            days_frame.pack(side=tk.LEFT, padx=5)
-            days_frame.pack_propagate(False)
-            
-            days_text = str(days_left) if days_left >= 0 else "Expired"
-            tk.Label(days_frame, text=days_text, 
-                    font=ModernStyle.FONT_BODY_BOLD,
-                    bg=row_bg, fg=status_color,
-                    anchor='center').pack(fill=tk.X, padx=5)
-            
-            # Status badge
-            status_frame = tk.Frame(row_frame, bg=row_bg, width=120)
-            status_frame.pack(side=tk.LEFT, padx=5)
-            status_frame.pack_propagate(False)
-            
-            status_badge = tk.Label(status_frame, text=status_text, 
-                                   font=ModernStyle.FONT_SMALL,
-                                   bg=status_color, fg='white',
-                                   padx=10, pady=4)
-            status_badge.pack(pady=8)
-        
-        # Show count
-        count_label = tk.Label(self.membership_frame, 
-                              text=f"\nTotal Members: {len(memberships)}", 
-                              font=ModernStyle.FONT_BODY_BOLD,
-                              bg=ModernStyle.BG_CARD, 
-                              fg=ModernStyle.TEXT_PRIMARY)
-        count_label.pack(pady=20)
-    
-    def export_to_excel(self):
-        """Export membership data to Excel"""
-        try:
-            # Get filtered data
-            con = self.db_manager.get_db(self.current_unit)
-            
-            query = """
-                SELECT 
-                    m.name, m.phone, m.email, m.gender,
-                    p.name as plan_name, p.price,
-                    s.start_date, s.end_date, s.status, s.notes
-                FROM subscriptions s
-                JOIN members m ON s.member_id = m.id
-                JOIN plans p ON s.plan_id = p.id
-                WHERE s.status = 'active'
-            """
-            
-            params = []
-            
-            if self.month_var.get() != 'All':
-                month_num = ['January', 'February', 'March', 'April', 'May', 'June',
-                            'July', 'August', 'September', 'October', 'November', 'December'].index(self.month_var.get()) + 1
-                query += " AND CAST(strftime('%m', s.end_date) AS INTEGER) = ?"
-                params.append(month_num)
-            
-            if self.year_var.get() != 'All':
-                query += " AND strftime('%Y', s.end_date) = ?"
-                params.append(self.year_var.get())
-            
-            query += " ORDER BY s.end_date ASC"
-            
-            memberships = con.execute(query, params).fetchall()
-            con.close()
-            
-            if not memberships:
-                messagebox.showinfo("No Data", "No memberships found with current filters.")
-                return
-            
-            # Ask user where to save
-            filename = filedialog.asksaveasfilename(
-                defaultextension='.xlsx',
-                filetypes=[('Excel files', '*.xlsx')],
-                initialfile=f'memberships_{self.current_unit}_{datetime.now().strftime("%Y%m%d")}.xlsx'
-            )
-            
-            if not filename:
-                return
-            
-            # Create workbook
-            wb = Workbook()
-            ws = wb.active
-            ws.title = f"{self.current_unit.upper()} Memberships"
-            
-            # Styling
-            header_fill = PatternFill(start_color='6C5CE7', end_color='6C5CE7', fill_type='solid')
-            header_font = Font(bold=True, color='FFFFFF', size=12)
-            border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            
-            # Headers
-            headers = ['Member Name', 'Phone', 'Email', 'Gender', 'Plan', 'Price', 
-                      'Start Date', 'End Date', 'Days Left', 'Status', 'Notes']
-            
-            for col_num, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col_num, value=header)
-                cell.fill = header_fill
-                cell.font = header_font
-                cell.alignment = Alignment(horizontal='center', vertical='center')
-                cell.border = border
-            
-            # Data rows
-            today = date.today()
-            
-            for row_num, membership in enumerate(memberships, 2):
-                end_date = datetime.strptime(membership['end_date'], '%Y-%m-%d').date()
-                days_left = (end_date - today).days
-                
-                if days_left < 0:
-                    status_text = "Expired"
-                    row_color = 'FF6B6B'
-                elif days_left <= 7:
-                    status_text = "Expiring Soon"
-                    row_color = 'FF6B6B'
-                elif days_left <= 30:
-                    status_text = "Expiring"
-                    row_color = 'FDCB6E'
-                else:
-                    status_text = "Active"
-                    row_color = '00D9A3'
-                
-                row_data = [
-                    membership['name'],
-                    membership['phone'],
-                    membership['email'] or 'N/A',
-                    membership['gender'] or 'N/A',
-                    membership['plan_name'],
-                    f"₹{membership['price']:.2f}",
-                    membership['start_date'],
-                    membership['end_date'],
-                    days_left if days_left >= 0 else 'Expired',
-                    status_text,
-                    membership['notes'] or ''
-                ]
-                
-                for col_num, value in enumerate(row_data, 1):
-                    cell = ws.cell(row=row_num, column=col_num, value=value)
-                    cell.border = border
-                    cell.alignment = Alignment(horizontal='left', vertical='center')
-                    
-                    # Color status cell
-                    if col_num == 10:  # Status column
-                        cell.fill = PatternFill(start_color=row_color, end_color=row_color, fill_type='solid')
-                        cell.font = Font(bold=True, color='FFFFFF')
-                        cell.alignment = Alignment(horizontal='center', vertical='center')
-            
-            # Adjust column widths
-            column_widths = [20, 15, 25, 10, 15, 12, 12, 12, 12, 15, 30]
-            for col_num, width in enumerate(column_widths, 1):
-                ws.column_dimensions[chr(64 + col_num)].width = width
-            
-            # Add summary
-            summary_row = len(memberships) + 3
-            ws.cell(row=summary_row, column=1, value="Summary").font = Font(bold=True, size=14)
-            ws.cell(row=summary_row + 1, column=1, value=f"Total Members: {len(memberships)}")
-            ws.cell(row=summary_row + 2, column=1, value=f"Unit: {self.current_unit.upper()}")
-            ws.cell(row=summary_row + 3, column=1, value=f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-            # Save workbook
-            wb.save(filename)
-            
-            messagebox.showinfo("Success", f"Membership data exported successfully!\n\nFile saved: {filename}")
-            
-        except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export data:\n{str(e)}")
-    
-    def on_unit_change(self, event=None):
-        """Handle unit change"""
-        self.current_unit = self.unit_var.get()
-        self.load_memberships()
-    
-    def logout(self):
-        """Logout user"""
-        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
-            self.root.withdraw()
-            for widget in self.root.winfo_children():
-                widget.destroy()
-            self.current_user = None
-            self.current_unit = None
-            LoginWindow(self.root, self.on_login_success)
-
-if __name__ == '__main__':
-    root = tk.Tk()
-    app = GymChatApp(root)
+"""
+GymChat Pro - Premium Multi-Unit Gym Management System
+Modern UI with glassmorphism, animations, and premium design
+
+To create EXE:
+pip install pyinstaller tkinter pillow python-dateutil openpyxl numpy
+pyinstaller --onefile --windowed --name GymChatPro gym_chat_pro.py
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, filedialog
+from tkinter import font as tkfont
+import sqlite3
+import pathlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date
+from dateutil.relativedelta import relativedelta
+import functools
+import itertools
+import hashlib
+import json
+import re
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.utils import get_column_letter
+from PIL import Image, ImageTk
+import numpy as np
+
+# Calendar months for the expiry filters - the dict gives O(1) name -> number
+_MONTHS = ('January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+MONTH_TO_NUM = {month: num for num, month in enumerate(_MONTHS, 1)}
+
+class ModernStyle:
+    """Modern UI styling with premium colors and effects"""
+    
+    # Premium color palette - Dark mode with vibrant accents
+    BG_DARK = '#0A0E27'
+    BG_CARD = '#1A1F3A'
+    BG_CARD_HOVER = '#252B4A'
+    
+    ACCENT_PRIMARY = '#6C5CE7'  # Purple
+    ACCENT_SECONDARY = '#A29BFE'  # Light purple
+    ACCENT_SUCCESS = '#00D9A3'  # Mint green
+    ACCENT_WARNING = '#FDCB6E'  # Gold
+    ACCENT_DANGER = '#FF6B6B'  # Coral red
+    
+    TEXT_PRIMARY = '#FFFFFF'
+    TEXT_SECONDARY = '#A0AEC0'
+    TEXT_MUTED = '#718096'
+    
+    GRADIENT_START = '#667EEA'
+    GRADIENT_END = '#764BA2'
+    
+    # Chat colors
+    CHAT_BG = '#0F1419'
+    MY_MESSAGE = '#6C5CE7'
+    OTHER_MESSAGE = '#2D3748'
+    
+    # Cache of (hex color, factor) -> adjusted hex color; the palette is
+    # tiny so this saturates at about a dozen entries
+    _COLOR_CACHE = {}
+
+    # Fonts
+    FONT_HEADING = ('Segoe UI', 24, 'bold')
+    FONT_SUBHEADING = ('Segoe UI', 16, 'bold')
+    FONT_BODY = ('Segoe UI', 11)
+    FONT_BODY_BOLD = ('Segoe UI', 11, 'bold')
+    FONT_SMALL = ('Segoe UI', 9)
+    FONT_BUTTON = ('Segoe UI', 10, 'bold')
+
+    @classmethod
+    def init_fonts(cls, root):
+        """Promote the FONT_* tuples to Font objects once the root exists
+
+        Labels then hand Tk a pre-parsed font descriptor instead of making
+        it convert the ('Segoe UI', 11) tuple on every widget.
+        """
+        if isinstance(cls.FONT_BODY, tkfont.Font):
+            return
+        cls.FONT_HEADING = tkfont.Font(root=root, family='Segoe UI', size=24, weight='bold')
+        cls.FONT_SUBHEADING = tkfont.Font(root=root, family='Segoe UI', size=16, weight='bold')
+        cls.FONT_BODY = tkfont.Font(root=root, family='Segoe UI', size=11)
+        cls.FONT_BODY_BOLD = tkfont.Font(root=root, family='Segoe UI', size=11, weight='bold')
+        cls.FONT_SMALL = tkfont.Font(root=root, family='Segoe UI', size=9)
+        cls.FONT_BUTTON = tkfont.Font(root=root, family='Segoe UI', size=10, weight='bold')
+
+    _ttk_styles_installed = False
+
+    @classmethod
+    def install_ttk_styles(cls, root):
+        """Register the ttk styles once per process - repeat calls are no-ops"""
+        if cls._ttk_styles_installed:
+            return
+        style = ttk.Style(root)
+        style.configure('Unit.TCombobox',
+                        fieldbackground=cls.BG_DARK,
+                        background=cls.ACCENT_PRIMARY,
+                        foreground=cls.TEXT_PRIMARY)
+        style.configure('Membership.Treeview',
+                        background=cls.BG_DARK,
+                        fieldbackground=cls.BG_DARK,
+                        foreground=cls.TEXT_PRIMARY,
+                        font=cls.FONT_BODY,
+                        rowheight=34)
+        style.configure('Membership.Treeview.Heading',
+                        background=cls.ACCENT_PRIMARY,
+                        foreground='white',
+                        font=cls.FONT_BODY_BOLD)
+        cls._ttk_styles_installed = True
+
+class DatabaseManager:
+    """Manages multiple databases for different gym units"""
+
+    # Bump whenever the unit schema script below changes, so existing
+    # database files get the new DDL applied on the next start
+    SCHEMA_VERSION = 2
+
+    # Session-level PRAGMAs - must be re-applied on every new connection
+    SESSION_PRAGMAS = """
+        PRAGMA synchronous = NORMAL;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -65536;
+        PRAGMA mmap_size = 268435456;
+        PRAGMA foreign_keys = ON;
+    """
+
+    def __init__(self):
+        self.base_path = pathlib.Path('gym_units')
+        self.base_path.mkdir(exist_ok=True)
+        self.units = ['unit1', 'unit2', 'unit3', 'unit4', 'unit5', 'unit6', 'unit7']
+        self._wal_set = set()
+        self._pool = {}
+        self._lock = threading.RLock()
+
+    def get_db_path(self, unit):
+        return self.base_path / f'{unit}.db'
+
+    def get_db(self, unit):
+        """Return the pooled connection for a unit, creating it on first use"""
+        with self._lock:
+            con = self._pool.get(unit)
+            if con is None:
+                con = sqlite3.connect(self.get_db_path(unit),
+                                      check_same_thread=False)
+                con.row_factory = sqlite3.Row
+                self.tune_connection(con, unit)
+                self._pool[unit] = con
+            return con
+
+    def get_auth_db(self):
+        """Pooled connection to the shared auth database"""
+        return self.get_db('auth')
+
+    def close_all(self):
+        """Close every pooled connection (app shutdown)"""
+        with self._lock:
+            for con in self._pool.values():
+                con.close()
+            self._pool.clear()
+
+    def tune_connection(self, con, db_key):
+        """Apply WAL and performance PRAGMAs to a fresh connection"""
+        # journal_mode=WAL is persistent per database file, so issue it only
+        # the first time each database is opened in this process
+        if db_key not in self._wal_set:
+            con.execute("PRAGMA journal_mode = WAL")
+            self._wal_set.add(db_key)
+        con.executescript(self.SESSION_PRAGMAS)
+    
+    def init_all_databases(self):
+        # Each unit is its own database file, so there is no shared lock and
+        # the initializations can run in parallel. Only the cheap, idempotent
+        # schema setup runs here - sample data is seeded lazily by
+        # ensure_unit_seeded when a unit is actually viewed.
+        with ThreadPoolExecutor(max_workers=len(self.units)) as executor:
+            list(executor.map(self.ensure_unit_schema, self.units))
+        self.init_auth_db()
+
+    def ensure_unit_schema(self, unit):
+        con = self.get_db(unit)
+
+        # On warm starts the file already carries the current schema, so skip
+        # parsing and running the whole DDL script
+        version = con.execute("PRAGMA user_version").fetchone()[0]
+        if version == self.SCHEMA_VERSION:
+            return
+
+        # BEGIN/COMMIT live inside the script: one fsync for the whole
+        # schema + seed-plan setup instead of one per statement
+        con.executescript("""
+            PRAGMA foreign_keys = ON;
+
+            BEGIN;
+
+            CREATE TABLE IF NOT EXISTS members (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                phone TEXT NOT NULL UNIQUE,
+                email TEXT,
+                gender TEXT,
+                dob TEXT,
+                created_at TEXT DEFAULT (datetime('now')),
+                avatar TEXT DEFAULT '👤'
+            );
+            
+            CREATE TABLE IF NOT EXISTS plans (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE,
+                duration_months INTEGER NOT NULL CHECK(duration_months > 0),
+                price REAL NOT NULL CHECK(price >= 0)
+            );
+            
+            CREATE TABLE IF NOT EXISTS subscriptions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                member_id INTEGER NOT NULL REFERENCES members(id) ON DELETE CASCADE,
+                plan_id INTEGER NOT NULL REFERENCES plans(id),
+                start_date TEXT NOT NULL,
+                end_date TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'active',
+                notes TEXT
+            );
+            
+            CREATE TABLE IF NOT EXISTS chats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chat_id TEXT UNIQUE NOT NULL,
+                chat_name TEXT NOT NULL,
+                chat_type TEXT NOT NULL,
+                member_id INTEGER REFERENCES members(id),
+                created_at TEXT DEFAULT (datetime('now'))
+            );
+            
+            CREATE TABLE IF NOT EXISTS messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chat_id TEXT NOT NULL,
+                sender_name TEXT NOT NULL,
+                sender_role TEXT NOT NULL,
+                message TEXT NOT NULL,
+                timestamp TEXT DEFAULT (datetime('now')),
+                read_status INTEGER DEFAULT 0
+            );
+            
+            CREATE TABLE IF NOT EXISTS notifications (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                subscription_id INTEGER REFERENCES subscriptions(id),
+                member_id INTEGER REFERENCES members(id),
+                channel TEXT NOT NULL,
+                message TEXT NOT NULL,
+                sent_at TEXT,
+                status TEXT DEFAULT 'pending'
+            );
+            
+            CREATE INDEX IF NOT EXISTS idx_subs_end_date ON subscriptions(end_date);
+            CREATE INDEX IF NOT EXISTS idx_subs_status_end ON subscriptions(status, end_date);
+            CREATE INDEX IF NOT EXISTS idx_subs_member ON subscriptions(member_id);
+            CREATE INDEX IF NOT EXISTS idx_subs_plan ON subscriptions(plan_id);
+            CREATE INDEX IF NOT EXISTS idx_messages_chat ON messages(chat_id, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_notifications_sub ON notifications(subscription_id);
+
+            INSERT OR IGNORE INTO plans(name, duration_months, price) VALUES
+                ('Monthly', 1, 999.0),
+                ('Quarterly', 3, 2699.0),
+                ('Half-Yearly', 6, 4999.0),
+                ('Yearly', 12, 8999.0);
+                
+            INSERT OR IGNORE INTO chats(chat_id, chat_name, chat_type)
+            VALUES ('group_general', 'General Announcements', 'group');
+
+            COMMIT;
+        """)
+        con.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def ensure_unit_seeded(self, unit):
+        """Add sample data to a unit the first time it is viewed, if empty"""
+        con = self.get_db(unit)
+        member_count = con.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+        if member_count == 0:
+            self.add_sample_data(con)
+
+    def add_sample_data(self, con):
+        """Add sample members and subscriptions"""
+        import random
+        
+        # Sample data
+        avatars = ['👨', '👩', '🧑', '👨‍💼', '👩‍💼', '🧔', '👨‍🦱', '👩‍🦰', '👨‍🦳', '👩‍🦳']
+        first_names = ['Raj', 'Priya', 'Amit', 'Sneha', 'Vikram', 'Anjali', 'Rahul', 'Divya', 
+                      'Arjun', 'Kavya', 'Karthik', 'Meera', 'Suresh', 'Lakshmi', 'Arun']
+        last_names = ['Kumar', 'Sharma', 'Patel', 'Singh', 'Reddy', 'Nair', 'Iyer', 'Gupta',
+                     'Rao', 'Joshi', 'Mehta', 'Shah', 'Pillai', 'Menon', 'Agarwal']
+        
+        today = date.today()
+        
+        # Reduced to 10 sample members for faster initial load
+        sample_size = 10
+
+        # Sequential numbers keep the phone UNIQUE constraint safe no matter
+        # how large the sample grows (names may still repeat)
+        phones = [f"+91{7000000000 + i * 111_111_111:010d}" for i in range(sample_size)]
+
+        members_rows = [
+            (f"{random.choice(first_names)} {random.choice(last_names)}",
+             phones[i],
+             f"member{i}@email.com",
+             random.choice(['Male', 'Female']),
+             date(random.randint(1985, 2000), random.randint(1, 12), random.randint(1, 28)).isoformat(),
+             random.choice(avatars))
+            for i in range(sample_size)
+        ]
+
+        # Fetch all plan durations once instead of one SELECT per member
+        plan_durations = dict(con.execute("SELECT id, duration_months FROM plans").fetchall())
+
+        # One transaction for the whole sample set: commits on success,
+        # rolls everything back if anything in the middle fails
+        with con:
+            # Batch insert all members in one statement
+            con.executemany("""
+                INSERT INTO members(name, phone, email, gender, dob, avatar)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, members_rows)
+
+            # Rowids are contiguous inside the transaction, so recover the new
+            # ids from last_insert_rowid() instead of tracking lastrowid per insert
+            last_id = con.execute("SELECT last_insert_rowid()").fetchone()[0]
+            members = list(range(last_id - len(members_rows) + 1, last_id + 1))
+
+            # Create subscriptions with various expiry dates
+            plan_ids = [1, 2, 3, 4]  # Monthly, Quarterly, Half-Yearly, Yearly
+
+            # Batch insert for better performance
+            subscription_data = []
+            for member_id in members:
+                plan_id = random.choice(plan_ids)
+                duration = plan_durations[plan_id]
+
+                # Random start date in past (0-6 months ago)
+                months_ago = random.randint(0, 6)
+                start_date = today - relativedelta(months=months_ago)
+                end_date = start_date + relativedelta(months=duration)
+
+                # Create different scenarios
+                scenario = random.random()
+                if scenario < 0.2:  # 20% expired
+                    start_date = today - relativedelta(months=duration+2)
+                    end_date = today - relativedelta(months=2)
+                elif scenario < 0.4:  # 20% expiring within 30 days
+                    start_date = today - relativedelta(months=duration, days=-15)
+                    end_date = today + relativedelta(days=15)
+
+                notes = random.choice(['Regular member', 'Morning batch', 'Evening batch', ''])
+
+                subscription_data.append((member_id, plan_id, start_date.isoformat(),
+                                        end_date.isoformat(), notes))
+
+            # Batch insert all subscriptions
+            con.executemany("""
+                INSERT INTO subscriptions(member_id, plan_id, start_date, end_date, status, notes)
+                VALUES (?, ?, ?, ?, 'active', ?)
+            """, subscription_data)
+    
+    def init_auth_db(self):
+        con = self.get_db('auth')
+        con.executescript("""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                username TEXT NOT NULL UNIQUE,
+                password_hash TEXT NOT NULL,
+                role TEXT NOT NULL,
+                unit TEXT,
+                full_name TEXT NOT NULL,
+                created_at TEXT DEFAULT (datetime('now'))
+            );
+            
+            CREATE TABLE IF NOT EXISTS login_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER REFERENCES users(id),
+                login_time TEXT DEFAULT (datetime('now')),
+                unit_accessed TEXT
+            );
+        """)
+        
+        # Only hash and insert accounts that don't exist yet - on warm starts
+        # every account is already present and this becomes a single SELECT
+        existing = {row[0] for row in con.execute("SELECT username FROM users")}
+
+        user_rows = []
+        if 'owner' not in existing:
+            owner_hash = hashlib.sha256('owner123'.encode()).hexdigest()
+            user_rows.append(('owner', owner_hash, 'owner', None, 'Gym Owner'))
+
+        for unit in self.units:
+            if unit not in existing:
+                unit_hash = hashlib.sha256(unit.encode()).hexdigest()
+                user_rows.append((unit, unit_hash, 'unit_admin', unit, f'{unit.title()} Admin'))
+
+        if user_rows:
+            # Context manager commits on success, rolls back on error
+            with con:
+                con.executemany("""
+                    INSERT INTO users(username, password_hash, role, unit, full_name)
+                    VALUES (?, ?, ?, ?, ?)
+                """, user_rows)
+
+class ModernButton(tk.Canvas):
+    """Custom modern button with hover effects"""
+    
+    def __init__(self, parent, text, command, bg_color, fg_color='white', 
+                 width=150, height=45, icon='', **kwargs):
+        super().__init__(parent, width=width, height=height, 
+                        bg=parent['bg'], highlightthickness=0, **kwargs)
+        
+        self.bg_color = bg_color
+        self.fg_color = fg_color
+        self.text = text
+        self.icon = icon
+        self.command = command
+        self.hover = False
+
+        # Pre-render both hover states once - hovering then only toggles
+        # which item set is visible instead of redrawing the whole button
+        self.draw_button(hover=False)
+        self.draw_button(hover=True)
+        self.itemconfigure('hover', state='hidden')
+
+        self.bind('<Button-1>', lambda e: self.on_click())
+        self.bind('<Enter>', lambda e: self.on_hover(True))
+        self.bind('<Leave>', lambda e: self.on_hover(False))
+
+    def draw_button(self, hover=False):
+        # Button background with rounded corners
+        radius = 23
+        color = self.adjust_color(self.bg_color, 1.2 if hover else 1.0)
+        tag = 'hover' if hover else 'normal'
+        w = self.winfo_reqwidth()
+        h = self.winfo_reqheight()
+
+        self.create_arc(0, 0, radius*2, radius*2,
+                       start=90, extent=90, fill=color, outline='', tags=tag)
+        self.create_arc(w-radius*2, 0, w, radius*2,
+                       start=0, extent=90, fill=color, outline='', tags=tag)
+        self.create_arc(0, h-radius*2, radius*2, h,
+                       start=180, extent=90, fill=color, outline='', tags=tag)
+        self.create_arc(w-radius*2, h-radius*2, w, h,
+                       start=270, extent=90, fill=color, outline='', tags=tag)
+
+        self.create_rectangle(radius, 0, w-radius, h,
+                            fill=color, outline='', tags=tag)
+        self.create_rectangle(0, radius, w, h-radius,
+                            fill=color, outline='', tags=tag)
+
+        # Text
+        full_text = f"{self.icon} {self.text}" if self.icon else self.text
+        self.create_text(w//2, h//2,
+                        text=full_text, fill=self.fg_color,
+                        font=ModernStyle.FONT_BUTTON, tags=tag)
+    
+    def adjust_color(self, color, factor):
+        """Lighten or darken a color, memoized in ModernStyle's color cache"""
+        adjusted = ModernStyle._COLOR_CACHE.get((color, factor))
+        if adjusted is None:
+            hex_part = color.lstrip('#')
+            r, g, b = int(hex_part[0:2], 16), int(hex_part[2:4], 16), int(hex_part[4:6], 16)
+            r = min(255, int(r * factor))
+            g = min(255, int(g * factor))
+            b = min(255, int(b * factor))
+            adjusted = f'#{r:02x}{g:02x}{b:02x}'
+            ModernStyle._COLOR_CACHE[(color, factor)] = adjusted
+        return adjusted
+    
+    def on_hover(self, entering):
+        self.hover = entering
+        self.itemconfigure('hover', state='normal' if entering else 'hidden')
+        self.itemconfigure('normal', state='hidden' if entering else 'normal')
+        self.config(cursor='hand2' if entering else '')
+    
+    def on_click(self):
+        if self.command:
+            self.command()
+
+class ModernEntry(tk.Frame):
+    """Modern entry field with floating label effect"""
+    
+    def __init__(self, parent, label, show=None):
+        super().__init__(parent, bg=ModernStyle.BG_CARD)
+        
+        self.label_text = label
+        
+        tk.Label(self, text=label, font=ModernStyle.FONT_SMALL,
+                bg=ModernStyle.BG_CARD, fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', pady=(0, 5))
+        
+        entry_frame = tk.Frame(self, bg=ModernStyle.BG_DARK, bd=0)
+        entry_frame.pack(fill=tk.X)
+        
+        self.entry = tk.Entry(entry_frame, font=ModernStyle.FONT_BODY,
+                             bg=ModernStyle.BG_DARK, fg=ModernStyle.TEXT_PRIMARY,
+                             insertbackground=ModernStyle.ACCENT_PRIMARY,
+                             relief=tk.FLAT, bd=0, show=show)
+        self.entry.pack(fill=tk.X, padx=15, pady=12)
+        
+    def get(self):
+        return self.entry.get()
+    
+    def insert(self, index, text):
+        self.entry.insert(index, text)
+
+class LoginWindow:
+    """Premium login window with gradient background"""
+    
+    def __init__(self, parent, db_manager, on_success):
+        self.parent = parent
+        self.db_manager = db_manager
+        self.on_success = on_success
+        self.window = tk.Toplevel(parent)
+        self.window.title("GymChat Pro - Login")
+        self.window.geometry("500x700")
+        self.window.configure(bg=ModernStyle.BG_DARK)
+        self.window.transient(parent)
+        self.window.grab_set()
+        
+        # Center window
+        self.window.update_idletasks()
+        x = (self.window.winfo_screenwidth() // 2) - 250
+        y = (self.window.winfo_screenheight() // 2) - 350
+        self.window.geometry(f'500x700+{x}+{y}')
+        
+        self.setup_ui()
+        
+    def setup_ui(self):
+        # Header with gradient effect
+        header = tk.Frame(self.window, bg=ModernStyle.BG_CARD, height=200)
+        header.pack(fill=tk.X)
+        header.pack_propagate(False)
+        
+        # Logo and title
+        logo_frame = tk.Frame(header, bg=ModernStyle.BG_CARD)
+        logo_frame.pack(expand=True)
+        
+        tk.Label(logo_frame, text="💪", font=('Arial', 60),
+                bg=ModernStyle.BG_CARD).pack()
+        
+        tk.Label(logo_frame, text="GymChat Pro", 
+                font=('Segoe UI', 32, 'bold'),
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_PRIMARY).pack()
+        
+        tk.Label(logo_frame, text="Multi-Unit Management System", 
+                font=ModernStyle.FONT_BODY,
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_SECONDARY).pack(pady=(5, 0))
+        
+        # Form container
+        form_container = tk.Frame(self.window, bg=ModernStyle.BG_DARK)
+        form_container.pack(fill=tk.BOTH, expand=True, padx=40, pady=40)
+        
+        # Login form card
+        form_card = tk.Frame(form_container, bg=ModernStyle.BG_CARD, bd=0)
+        form_card.pack(fill=tk.BOTH, expand=True)
+        
+        form_inner = tk.Frame(form_card, bg=ModernStyle.BG_CARD)
+        form_inner.pack(fill=tk.BOTH, expand=True, padx=30, pady=30)
+        
+        tk.Label(form_inner, text="Welcome Back!", 
+                font=ModernStyle.FONT_SUBHEADING,
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_PRIMARY).pack(pady=(0, 30))
+        
+        # Username field
+        self.username_field = ModernEntry(form_inner, "Username")
+        self.username_field.pack(fill=tk.X, pady=(0, 20))
+        
+        # Password field
+        self.password_field = ModernEntry(form_inner, "Password", show='●')
+        self.password_field.pack(fill=tk.X, pady=(0, 30))
+        self.password_field.entry.bind('<Return>', lambda e: self.login())
+        
+        # Login button
+        btn_frame = tk.Frame(form_inner, bg=ModernStyle.BG_CARD)
+        btn_frame.pack(fill=tk.X)
+        
+        login_btn = ModernButton(btn_frame, "Login", self.login,
+                                ModernStyle.ACCENT_PRIMARY, 
+                                width=400, height=50, icon='🔐')
+        login_btn.pack(pady=(0, 20))
+        
+        # Info card
+        info_card = tk.Frame(form_inner, bg=ModernStyle.BG_DARK, bd=0)
+        info_card.pack(fill=tk.X, pady=(10, 0))
+        
+        info_inner = tk.Frame(info_card, bg=ModernStyle.BG_DARK)
+        info_inner.pack(fill=tk.X, padx=20, pady=20)
+        
+        tk.Label(info_inner, text="ℹ  Default Credentials", 
+                font=ModernStyle.FONT_BODY_BOLD,
+                bg=ModernStyle.BG_DARK, 
+                fg=ModernStyle.ACCENT_WARNING).pack(pady=(0, 10))
+        
+        tk.Label(info_inner, text="Owner: owner / owner123",
+                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
+                fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', padx=20)
+        
+        tk.Label(info_inner, text="Unit Admin: unit1 / unit1",
+                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
+                fg=ModernStyle.TEXT_SECONDARY).pack(anchor='w', padx=20)
+        
+        tk.Label(info_inner, text="(unit2-unit7 follow same pattern)",
+                font=ModernStyle.FONT_SMALL, bg=ModernStyle.BG_DARK,
+                fg=ModernStyle.TEXT_MUTED).pack(anchor='w', padx=20, pady=(0, 5))
+        
+    def login(self):
+        username = self.username_field.get().strip()
+        password = self.password_field.get().strip()
+        
+        if not username or not password:
+            messagebox.showerror("Error", "Please enter username and password")
+            return
+        
+        password_hash = hashlib.sha256(password.encode()).hexdigest()
+
+        # Pooled, already-tuned connection - no per-login file open
+        con = self.db_manager.get_auth_db()
+
+        # One transaction covers the lookup and the login log entry
+        with con:
+            user = con.execute("""
+                SELECT * FROM users
+                WHERE username = ? AND password_hash = ?
+            """, (username, password_hash)).fetchone()
+
+            if user:
+                con.execute("""
+                    INSERT INTO login_logs(user_id, unit_accessed)
+                    VALUES (?, ?)
+                """, (user['id'], user['unit']))
+
+        if user:
+            user_data = {
+                'id': user['id'],
+                'username': user['username'],
+                'role': user['role'],
+                'unit': user['unit'],
+                'full_name': user['full_name']
+            }
+
+            self.window.destroy()
+            self.on_success(user_data)
+        else:
+            messagebox.showerror("Login Failed", "Invalid username or password")
+
+class GymChatApp:
+    """Main application with premium UI"""
+    
+    def __init__(self, root):
+        self.root = root
+        self.root.title("GymChat Pro - Multi-Unit Management")
+        self.root.geometry("1400x850")
+        self.root.minsize(1200, 700)
+        self.root.configure(bg=ModernStyle.BG_DARK)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        ModernStyle.init_fonts(self.root)
+        ModernStyle.install_ttk_styles(self.root)
+
+        self.db_manager = None
+
+        # Single worker keeps membership queries off the Tk thread and
+        # naturally serializes them; the latest submitted filter wins
+        self._query_executor = ThreadPoolExecutor(max_workers=1)
+        self._load_future = None
+
+        # Revisiting a (unit, month, year) filter combination hits this
+        # cache instead of re-running the JOIN; cleared whenever
+        # subscription data changes
+        self._membership_cache = functools.lru_cache(maxsize=32)(self._fetch_memberships)
+
+        # Virtualized table state: the full row list plus the index of the
+        # first row currently materialized in the Treeview
+        self._all_rows = []
+        self._view_start = 0
+
+        # Show loading splash
+        self.show_loading_splash()
+        
+        # Initialize database in background
+        self.root.after(100, self.init_database)
+        
+    def show_loading_splash(self):
+        """Show loading splash screen"""
+        self.splash = tk.Toplevel(self.root)
+        self.splash.title("Loading...")
+        self.splash.geometry("400x300")
+        self.splash.configure(bg=ModernStyle.BG_CARD)
+        self.splash.overrideredirect(True)
+        
+        # Center splash
+        self.splash.update_idletasks()
+        x = (self.splash.winfo_screenwidth() // 2) - 200
+        y = (self.splash.winfo_screenheight() // 2) - 150
+        self.splash.geometry(f'400x300+{x}+{y}')
+        
+        tk.Label(self.splash, text="💪", font=('Arial', 60),
+                bg=ModernStyle.BG_CARD).pack(pady=(40, 20))
+        
+        tk.Label(self.splash, text="GymChat Pro", 
+                font=('Segoe UI', 28, 'bold'),
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_PRIMARY).pack()
+        
+        tk.Label(self.splash, text="Loading databases...", 
+                font=ModernStyle.FONT_BODY,
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_SECONDARY).pack(pady=(20, 0))
+        
+    def init_database(self):
+        """Kick off database initialization on a worker thread"""
+        threading.Thread(target=self._init_db_worker, daemon=True).start()
+
+    def _init_db_worker(self):
+        """Initialize all databases off the Tk thread so the splash stays live"""
+        db_manager = DatabaseManager()
+        db_manager.init_all_databases()
+        self.db_manager = db_manager
+        self.root.after(0, self._init_db_done)
+
+    def _init_db_done(self):
+        """Back on the Tk thread: close splash and show login"""
+        self.current_user = None
+        self.current_unit = None
+        self.active_chat = None
+
+        self.splash.destroy()
+        self.root.withdraw()
+        LoginWindow(self.root, self.db_manager, self.on_login_success)
+        
+    def on_login_success(self, user_data):
+        self.current_user = user_data
+        
+        if user_data['role'] == 'owner':
+            self.accessible_units = self.db_manager.units
+            self.current_unit = 'unit1'
+        else:
+            self.accessible_units = [user_data['unit']]
+            self.current_unit = user_data['unit']
+
+        # Seed only the unit actually being viewed; seeding writes
+        # subscriptions, so drop any cached query results
+        self.db_manager.ensure_unit_seeded(self.current_unit)
+        self._membership_cache.cache_clear()
+
+        self.root.deiconify()
+        self.setup_ui()
+        
+    def create_gradient_header(self, parent):
+        """Create gradient header"""
+        canvas = tk.Canvas(parent, height=80, bg=ModernStyle.BG_CARD,
+                          highlightthickness=0)
+        canvas.pack(fill=tk.X)
+
+        # Interpolate the gradient as a 1-pixel-wide NumPy column; full-width
+        # images are produced on demand by _resize_gradient and cached, so
+        # window resizes cost one NEAREST stretch + bitblt at most
+        height = 80
+        t = np.linspace(0.0, 1.0, height)[:, None]
+        start = np.array([0x66, 0x7E, 0xEA])  # ModernStyle.GRADIENT_START
+        end = np.array([0x76, 0x4B, 0xA2])    # ModernStyle.GRADIENT_END
+        column = ((1.0 - t) * start + t * end).astype(np.uint8)
+
+        self._gradient_base = Image.fromarray(column[:, None, :])
+        self._gradient_cache = {}
+        self._gradient_canvas = canvas
+        self._gradient_item = canvas.create_image(0, 0, anchor='nw')
+
+        self._resize_gradient(1400)
+        canvas.bind('<Configure>', lambda e: self._resize_gradient(e.width))
+
+        return canvas
+
+    def _resize_gradient(self, width):
+        """Show the cached gradient image for this canvas width"""
+        if width <= 1:
+            return
+        photo = self._gradient_cache.get(width)
+        if photo is None:
+            # Keep only a handful of widths - drop the oldest on overflow
+            if len(self._gradient_cache) >= 4:
+                self._gradient_cache.pop(next(iter(self._gradient_cache)))
+            img = self._gradient_base.resize((width, self._gradient_base.height),
+                                             Image.NEAREST)
+            photo = ImageTk.PhotoImage(img)
+            self._gradient_cache[width] = photo
+        self._gradient_canvas.itemconfigure(self._gradient_item, image=photo)
+        
+    def setup_ui(self):
+        # Premium top bar with gradient
+        top_bar = tk.Frame(self.root, height=80)
+        top_bar.pack(fill=tk.X, side=tk.TOP)
+        top_bar.pack_propagate(False)
+        
+        gradient_canvas = self.create_gradient_header(top_bar)
+        
+        # Title and logo
+        title_frame = tk.Frame(gradient_canvas, bg='')
+        gradient_canvas.create_window(20, 40, window=title_frame, anchor='w')
+        
+        tk.Label(title_frame, text="💪", font=('Arial', 28),
+                bg='').pack(side=tk.LEFT, padx=(0, 10))
+        
+        title_text = tk.Frame(title_frame, bg='')
+        title_text.pack(side=tk.LEFT)
+        
+        tk.Label(title_text, text="GymChat Pro", 
+                font=('Segoe UI', 20, 'bold'),
+                fg=ModernStyle.TEXT_PRIMARY, bg='').pack(anchor='w')
+        
+        tk.Label(title_text, text="Multi-Unit Management System", 
+                font=ModernStyle.FONT_SMALL,
+                fg=ModernStyle.TEXT_SECONDARY, bg='').pack(anchor='w')
+        
+        # Unit selector for owner
+        if self.current_user['role'] == 'owner':
+            unit_frame = tk.Frame(gradient_canvas, bg='')
+            gradient_canvas.create_window(500, 40, window=unit_frame, anchor='w')
+            
+            tk.Label(unit_frame, text="Active Unit:", 
+                    font=ModernStyle.FONT_BODY_BOLD,
+                    fg=ModernStyle.TEXT_PRIMARY, bg='').pack(side=tk.LEFT, padx=(0, 10))
+            
+            self.unit_var = tk.StringVar(value=self.current_unit)
+            unit_menu = ttk.Combobox(unit_frame, textvariable=self.unit_var,
+                                    values=self.accessible_units, state='readonly',
+                                    width=12, font=ModernStyle.FONT_BODY,
+                                    style='Unit.TCombobox')
+            unit_menu.pack(side=tk.LEFT)
+            unit_menu.bind('<<ComboboxSelected>>', self.on_unit_change)
+        
+        # User profile section
+        user_frame = tk.Frame(gradient_canvas, bg='')
+        gradient_canvas.create_window(1350, 40, window=user_frame, anchor='e')
+        
+        profile_card = tk.Frame(user_frame, bg=ModernStyle.BG_CARD_HOVER, bd=0)
+        profile_card.pack(side=tk.RIGHT)
+        
+        profile_inner = tk.Frame(profile_card, bg=ModernStyle.BG_CARD_HOVER)
+        profile_inner.pack(padx=15, pady=8)
+        
+        role_emoji = '👑' if self.current_user['role'] == 'owner' else '⭐'
+        
+        tk.Label(profile_inner, text=f"{role_emoji} {self.current_user['full_name']}", 
+                font=ModernStyle.FONT_BODY_BOLD,
+                bg=ModernStyle.BG_CARD_HOVER, 
+                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT, padx=(0, 15))
+        
+        logout_btn = tk.Label(profile_inner, text="🚪 Logout",
+                            font=ModernStyle.FONT_SMALL,
+                            bg=ModernStyle.ACCENT_DANGER, 
+                            fg='white', cursor='hand2',
+                            padx=12, pady=4)
+        logout_btn.pack(side=tk.LEFT)
+        logout_btn.bind('<Button-1>', lambda e: self.logout())
+        
+        # Main container
+        main_container = tk.Frame(self.root, bg=ModernStyle.BG_DARK)
+        main_container.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)
+        
+        self.setup_content_area(main_container)
+        
+    def setup_content_area(self, parent):
+        content = tk.Frame(parent, bg=ModernStyle.BG_DARK)
+        content.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # Title
+        title_frame = tk.Frame(content, bg=ModernStyle.BG_DARK)
+        title_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        tk.Label(title_frame, text=f"📊 Membership Manager - {self.current_unit.upper()}", 
+                font=ModernStyle.FONT_HEADING,
+                bg=ModernStyle.BG_DARK, 
+                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT)
+        
+        # Month filter
+        filter_frame = tk.Frame(content, bg=ModernStyle.BG_CARD)
+        filter_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        filter_inner = tk.Frame(filter_frame, bg=ModernStyle.BG_CARD)
+        filter_inner.pack(padx=20, pady=15)
+        
+        tk.Label(filter_inner, text="Filter by Expiry Month:", 
+                font=ModernStyle.FONT_BODY_BOLD,
+                bg=ModernStyle.BG_CARD, 
+                fg=ModernStyle.TEXT_PRIMARY).pack(side=tk.LEFT, padx=(0, 15))
+        
+        # Month selector
+        months = ('All',) + _MONTHS
+
+        self.month_var = tk.StringVar(value='All')
+        month_menu = ttk.Combobox(filter_inner, textvariable=self.month_var,
+                                 values=months, state='readonly',
+                                 width=15, font=ModernStyle.FONT_BODY)
+        month_menu.pack(side=tk.LEFT, padx=(0, 15))
+        month_menu.bind('<<ComboboxSelected>>', lambda e: self.load_memberships())
+        
+        # Year selector
+        current_year = datetime.now().year
+        years = ['All'] + [str(y) for y in range(current_year, current_year + 3)]
+        
+        self.year_var = tk.StringVar(value=str(current_year))
+        year_menu = ttk.Combobox(filter_inner, textvariable=self.year_var,
+                                values=years, state='readonly',
+                                width=10, font=ModernStyle.FONT_BODY)
+        year_menu.pack(side=tk.LEFT, padx=(0, 15))
+        year_menu.bind('<<ComboboxSelected>>', lambda e: self.load_memberships())
+        
+        # Export button
+        export_btn = ModernButton(filter_inner, "Export to Excel", self.export_to_excel,
+                                 ModernStyle.ACCENT_SUCCESS, width=180, height=40, icon='📥')
+        export_btn.pack(side=tk.LEFT, padx=(15, 0))
+        
+        # Membership table - one Treeview draws every row on its own canvas
+        # instead of ~9 widgets per membership
+        table_frame = tk.Frame(content, bg=ModernStyle.BG_CARD)
+        table_frame.pack(fill=tk.BOTH, expand=True)
+
+        columns = [
+            ("name", "Member Name", 200),
+            ("phone", "Phone", 150),
+            ("plan", "Plan", 120),
+            ("start", "Start Date", 120),
+            ("end", "End Date", 120),
+            ("days", "Days Left", 100),
+            ("status", "Status", 120)
+        ]
+
+        self.tree = ttk.Treeview(table_frame,
+                                 columns=[col_id for col_id, _, _ in columns],
+                                 show="headings", style='Membership.Treeview')
+        for col_id, heading, width in columns:
+            self.tree.heading(col_id, text=heading)
+            self.tree.column(col_id, width=width, anchor='w')
+
+        # Status coloring and row striping via tags - no per-row widget config
+        self.tree.tag_configure('expired', foreground=ModernStyle.ACCENT_DANGER)
+        self.tree.tag_configure('expiring_soon', foreground=ModernStyle.ACCENT_DANGER)
+        self.tree.tag_configure('expiring', foreground=ModernStyle.ACCENT_WARNING)
+        self.tree.tag_configure('active', foreground=ModernStyle.ACCENT_SUCCESS)
+        self.tree.tag_configure('even', background=ModernStyle.BG_DARK)
+        self.tree.tag_configure('odd', background=ModernStyle.BG_CARD_HOVER)
+
+        # Scrolling goes through the virtualization handlers so that only a
+        # window of rows is materialized for very large result sets
+        self.tree_scrollbar = ttk.Scrollbar(table_frame, orient="vertical",
+                                            command=self._on_scroll)
+        self.tree.configure(yscrollcommand=self._on_tree_yview)
+        for event in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(event, self._on_mousewheel)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # Member count below the table
+        self.count_label = tk.Label(content, text="",
+                                    font=ModernStyle.FONT_BODY_BOLD,
+                                    bg=ModernStyle.BG_DARK,
+                                    fg=ModernStyle.TEXT_PRIMARY)
+        self.count_label.pack(pady=(10, 0))
+
+        # Load initial data
+        self.load_memberships()
+        
+    # One fixed clause per (month selected, year selected) combination. The
+    # SQL text is identical across calls, so sqlite3's internal statement
+    # cache reuses the compiled statement instead of re-parsing per query.
+    _FILTER_CLAUSES = {
+        (True, True): " AND s.end_date >= ? AND s.end_date < ?",
+        (False, True): " AND s.end_date >= ? AND s.end_date < ?",
+        (True, False): " AND CAST(strftime('%m', s.end_date) AS INTEGER) = ?",
+        (False, False): ""
+    }
+
+    def _expiry_filter(self, month, year):
+        """Return (sql_clause, params) for the expiry month/year filters
+
+        Explicit date ranges are sargable, so the (status, end_date) index
+        serves them directly; a month across every year has no contiguous
+        range and keeps the strftime match.
+        """
+        month_num = MONTH_TO_NUM.get(month)
+        has_year = year != 'All'
+        clause = self._FILTER_CLAUSES[(month_num is not None, has_year)]
+
+        if month_num and has_year:
+            lo = f"{year}-{month_num:02d}-01"
+            hi = f"{int(year) + 1}-01-01" if month_num == 12 else f"{year}-{month_num + 1:02d}-01"
+            return clause, [lo, hi]
+        if has_year:
+            return clause, [f"{year}-01-01", f"{int(year) + 1}-01-01"]
+        if month_num:
+            return clause, [month_num]
+        return clause, []
+
+    def load_memberships(self):
+        """Load membership data based on filters (query runs off the UI thread)"""
+        # Clear existing rows and show a placeholder while the query runs
+        self._all_rows = []
+        self._view_start = 0
+        self.tree.delete(*self.tree.get_children())
+        self.tree.insert("", "end", values=("Loading...",))
+        self.count_label.config(text="")
+
+        # Coalesce rapid filter changes: drop any still-queued query
+        if self._load_future is not None:
+            self._load_future.cancel()
+
+        future = self._query_executor.submit(self._query_memberships,
+                                             self.current_unit,
+                                             self.month_var.get(),
+                                             self.year_var.get())
+        self._load_future = future
+        future.add_done_callback(self._on_memberships_ready)
+
+    def _query_memberships(self, unit, month, year):
+        """Cached entry point for the membership query (worker thread)"""
+        return self._membership_cache(unit, month, year)
+
+    def _fetch_memberships(self, unit, month, year):
+        """Run the filtered membership query - executes on the worker thread"""
+        con = self.db_manager.get_db(unit)
+
+        # Build query based on filters
+        query = """
+            SELECT
+                m.id, m.name, m.phone, m.avatar,
+                p.name as plan_name,
+                s.start_date, s.end_date, s.status,
+                CAST(julianday(s.end_date) - julianday('now', 'localtime', 'start of day') AS INTEGER) AS days_left
+            FROM subscriptions s
+            JOIN members m ON s.member_id = m.id
+            JOIN plans p ON s.plan_id = p.id
+            WHERE s.status = 'active'
+        """
+
+        clause, params = self._expiry_filter(month, year)
+        query += clause + " ORDER BY s.end_date ASC"
+
+        # Plain dicts, not sqlite3.Row objects, so cached results stay
+        # independent of their originating cursor
+        return [dict(row) for row in con.execute(query, params)]
+
+    def _on_memberships_ready(self, future):
+        """Completion callback - hop back onto the Tk thread to render"""
+        if future.cancelled() or future is not self._load_future:
+            return
+        self.root.after(0, self._render_memberships, future.result())
+
+    # Below this row count everything is materialized and the Treeview
+    # scrolls natively; above it only a window of rows exists at a time
+    _VIRTUAL_THRESHOLD = 400
+    _WINDOW = 200
+
+    # Status buckets indexed by _status_index(), shared by the membership
+    # view and the Excel export: (label, treeview tag, fill color)
+    _STATUS_TABLE = (
+        ("Active", 'active', '00D9A3'),
+        ("Expiring", 'expiring', 'FDCB6E'),
+        ("Expiring Soon", 'expiring_soon', 'FF6B6B'),
+        ("Expired", 'expired', 'FF6B6B'),
+    )
+
+    @staticmethod
+    def _status_index(days_left):
+        """Map days_left to a _STATUS_TABLE slot"""
+        return 3 if days_left < 0 else (2 if days_left <= 7 else (1 if days_left <= 30 else 0))
+
+    def _render_memberships(self, memberships):
+        """Prepare the row list and show it - runs on the UI thread"""
+        # Bind loop-invariant lookups to locals; this runs once per row
+        # for potentially thousands of rows
+        status_table = self._STATUS_TABLE
+        status_index = self._status_index
+        rows = []
+        append = rows.append
+        for idx, membership in enumerate(memberships):
+            days_left = membership['days_left']
+
+            status_text, status_tag, _ = status_table[status_index(days_left)]
+
+            days_text = str(days_left) if days_left >= 0 else "Expired"
+
+            append(((
+                f"{membership['avatar']} {membership['name']}",
+                membership['phone'],
+                membership['plan_name'],
+                membership['start_date'],
+                membership['end_date'],
+                days_text,
+                status_text
+            ), (status_tag, 'even' if idx % 2 == 0 else 'odd')))
+
+        self._all_rows = rows
+        self._view_start = 0
+        self._refill_tree()
+
+        # Show count
+        self.count_label.config(text=f"Total Members: {len(memberships)}")
+
+    def _refill_tree(self):
+        """Materialize the current window of rows into the Treeview"""
+        tree = self.tree
+        tree.delete(*tree.get_children())
+
+        rows = self._all_rows
+        if len(rows) <= self._VIRTUAL_THRESHOLD:
+            window = rows
+        else:
+            window = rows[self._view_start:self._view_start + self._WINDOW]
+
+        for values, tags in window:
+            tree.insert("", "end", values=values, tags=tags)
+
+    def _set_view_start(self, start):
+        """Move the materialized window, clamped to the dataset"""
+        start = max(0, min(start, len(self._all_rows) - self._WINDOW))
+        if start != self._view_start:
+            self._view_start = start
+            self._refill_tree()
+
+    def _on_scroll(self, *args):
+        """Scrollbar command - moves the window when virtualized"""
+        n = len(self._all_rows)
+        if n <= self._VIRTUAL_THRESHOLD:
+            self.tree.yview(*args)
+            return
+        if args[0] == 'moveto':
+            self._set_view_start(int(float(args[1]) * n))
+        elif args[0] == 'scroll':
+            amount, what = int(args[1]), args[2]
+            step = self._WINDOW // 2 if what == 'pages' else 3
+            self._set_view_start(self._view_start + amount * step)
+
+    def _on_tree_yview(self, first, last):
+        """Tree yscrollcommand - maps the window back onto the full dataset"""
+        n = len(self._all_rows)
+        if n <= self._VIRTUAL_THRESHOLD or n == 0:
+            self.tree_scrollbar.set(first, last)
+            return
+        window = min(self._WINDOW, n)
+        lo = (self._view_start + float(first) * window) / n
+        hi = (self._view_start + float(last) * window) / n
+        self.tree_scrollbar.set(lo, hi)
+
+    def _on_mousewheel(self, event):
+        """Wheel scrolling shifts the window when virtualized"""
+        if len(self._all_rows) <= self._VIRTUAL_THRESHOLD:
+            return None  # let the Treeview scroll natively
+        if event.num == 4 or event.delta > 0:
+            self._set_view_start(self._view_start - 3)
+        else:
+            self._set_view_start(self._view_start + 3)
+        return "break"
+    
+    def export_to_excel(self):
+        """Export membership data to Excel"""
+        try:
+            # Get filtered data
+            con = self.db_manager.get_db(self.current_unit)
+            
+            query = """
+                SELECT
+                    m.name, m.phone, m.email, m.gender,
+                    p.name as plan_name, p.price,
+                    s.start_date, s.end_date, s.status, s.notes,
+                    CAST(julianday(s.end_date) - julianday('now', 'localtime', 'start of day') AS INTEGER) AS days_left
+                FROM subscriptions s
+                JOIN members m ON s.member_id = m.id
+                JOIN plans p ON s.plan_id = p.id
+                WHERE s.status = 'active'
+            """
+            
+            clause, params = self._expiry_filter(self.month_var.get(),
+                                                 self.year_var.get())
+            query += clause + " ORDER BY s.end_date ASC"
+            
+            # Stream rows from the cursor rather than materializing the whole
+            # result set; peek one row first for the empty check
+            cursor = con.execute(query, params)
+            first = cursor.fetchone()
+
+            if first is None:
+                messagebox.showinfo("No Data", "No memberships found with current filters.")
+                return
+
+            memberships = itertools.chain([first], cursor)
+            
+            # Ask user where to save
+            filename = filedialog.asksaveasfilename(
+                defaultextension='.xlsx',
+                filetypes=[('Excel files', '*.xlsx')],
+                initialfile=f'memberships_{self.current_unit}_{datetime.now().strftime("%Y%m%d")}.xlsx'
+            )
+            
+            if not filename:
+                return
+            
+            # Write-only workbook streams rows to disk instead of keeping the
+            # whole cell grid in memory
+            wb = Workbook(write_only=True)
+
+            # Pre-sanitize the sheet title (31-char limit, no \/*?:[])
+            # so openpyxl does not have to mangle it and warn
+            unit_upper = self.current_unit.upper()
+            safe_title = re.sub(r'[\\/*?:\[\]]', '_', f"{unit_upper} Memberships")[:31]
+            ws = wb.create_sheet(title=safe_title)
+
+            # Styling - every style object is created once and shared by
+            # reference; openpyxl styles are immutable, so no per-cell copies
+            header_fill = PatternFill(start_color='6C5CE7', end_color='6C5CE7', fill_type='solid')
+            header_font = Font(bold=True, color='FFFFFF', size=12)
+            border = Border(
+                left=Side(style='thin'),
+                right=Side(style='thin'),
+                top=Side(style='thin'),
+                bottom=Side(style='thin')
+            )
+            left_align = Alignment(horizontal='left', vertical='center')
+            center_align = Alignment(horizontal='center', vertical='center')
+            status_font = Font(bold=True, color='FFFFFF')
+            status_fills = {
+                color: PatternFill(start_color=color, end_color=color, fill_type='solid')
+                for color in ('FF6B6B', 'FDCB6E', '00D9A3')
+            }
+
+            # Column widths must be set before any row is appended in
+            # write-only mode
+            column_widths = [20, 15, 25, 10, 15, 12, 12, 12, 12, 15, 30]
+            for col_num, width in enumerate(column_widths, 1):
+                ws.column_dimensions[get_column_letter(col_num)].width = width
+
+            # Headers
+            headers = ['Member Name', 'Phone', 'Email', 'Gender', 'Plan', 'Price',
+                      'Start Date', 'End Date', 'Days Left', 'Status', 'Notes']
+
+            header_cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.fill = header_fill
+                cell.font = header_font
+                cell.alignment = center_align
+                cell.border = border
+                header_cells.append(cell)
+            ws.append(header_cells)
+
+            # Data rows - each one is built, appended and released
+            total_members = 0
+            for membership in memberships:
+                total_members += 1
+                days_left = membership['days_left']
+
+                status_text, _, row_color = self._STATUS_TABLE[self._status_index(days_left)]
+
+                row_data = [
+                    membership['name'],
+                    membership['phone'],
+                    membership['email'] or 'N/A',
+                    membership['gender'] or 'N/A',
+                    membership['plan_name'],
+                    f"₹{membership['price']:.2f}",
+                    membership['start_date'],
+                    membership['end_date'],
+                    days_left if days_left >= 0 else 'Expired',
+                    status_text,
+                    membership['notes'] or ''
+                ]
+
+                row_cells = []
+                for col_num, value in enumerate(row_data, 1):
+                    cell = WriteOnlyCell(ws, value=value)
+                    cell.border = border
+                    cell.alignment = left_align
+
+                    # Color status cell
+                    if col_num == 10:  # Status column
+                        cell.fill = status_fills[row_color]
+                        cell.font = status_font
+                        cell.alignment = center_align
+                    row_cells.append(cell)
+                ws.append(row_cells)
+
+            # Add summary
+            ws.append([])
+            summary_title = WriteOnlyCell(ws, value="Summary")
+            summary_title.font = Font(bold=True, size=14)
+            ws.append([summary_title])
+            ws.append([f"Total Members: {total_members}"])
+            ws.append([f"Unit: {unit_upper}"])
+            ws.append([f"Exported: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"])
+
+            # Save workbook
+            wb.save(filename)
+            
+            messagebox.showinfo("Success", f"Membership data exported successfully!\n\nFile saved: {filename}")
+            
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Failed to export data:\n{str(e)}")
+    
+    def on_unit_change(self, event=None):
+        """Handle unit change"""
+        self.current_unit = self.unit_var.get()
+        self.db_manager.ensure_unit_seeded(self.current_unit)
+        self._membership_cache.cache_clear()
+        self.load_memberships()
+    
+    def on_closing(self):
+        """Close pooled database connections and exit"""
+        self._query_executor.shutdown(wait=False, cancel_futures=True)
+        if self.db_manager:
+            self.db_manager.close_all()
+        self.root.destroy()
+
+    def logout(self):
+        """Logout user"""
+        if messagebox.askyesno("Logout", "Are you sure you want to logout?"):
+            self.root.withdraw()
+            for widget in self.root.winfo_children():
+                widget.destroy()
+            self.current_user = None
+            self.current_unit = None
+            # Drop pooled connections; they are recreated lazily on next login
+            self.db_manager.close_all()
+            LoginWindow(self.root, self.db_manager, self.on_login_success)
+
+if __name__ == '__main__':
+    root = tk.Tk()
+    app = GymChatApp(root)
     root.mainloop()
\ No newline at end of file